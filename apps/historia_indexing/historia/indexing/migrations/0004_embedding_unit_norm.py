@@ -0,0 +1,29 @@
+# Generated by Django 5.1.15 on 2026-10-14 03:49
+
+import numpy as np
+from django.db import migrations
+
+
+def normalize_embeddings(apps, schema_editor):
+    # emb_hnsw ranks by inner product, which only matches cosine on unit vectors.
+    Embedding = apps.get_model("indexing", "Embedding")
+    batch = []
+    for embedding in Embedding.objects.only("embedding").iterator(chunk_size=1000):
+        norm = np.linalg.norm(embedding.embedding)
+        if norm:
+            embedding.embedding = embedding.embedding / norm
+            batch.append(embedding)
+        if len(batch) == 1000:
+            Embedding.objects.bulk_update(batch, ["embedding"])
+            batch = []
+    Embedding.objects.bulk_update(batch, ["embedding"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("indexing", "0003_embedding_index_dimensions_alter_index_name_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_embeddings, migrations.RunPython.noop),
+    ]
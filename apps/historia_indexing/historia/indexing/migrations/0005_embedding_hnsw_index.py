@@ -0,0 +1,36 @@
+# Generated by Django 5.1.15 on 2026-10-14 03:49
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.operations
+import django.db.models.functions.comparison
+import pgvector.django.indexes
+import pgvector.django.vector
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction, and building
+    # the graph this way keeps indexing_embedding writable meanwhile.
+    atomic = False
+
+    dependencies = [
+        ("indexing", "0004_embedding_unit_norm"),
+    ]
+
+    operations = [
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name="embedding",
+            index=pgvector.django.indexes.HnswIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.comparison.Cast(
+                        "embedding", pgvector.django.vector.VectorField(dimensions=768)
+                    ),
+                    name="vector_ip_ops",
+                ),
+                condition=models.Q(("dimensions", 768)),
+                ef_construction=64,
+                m=16,
+                name="emb_hnsw",
+            ),
+        ),
+    ]
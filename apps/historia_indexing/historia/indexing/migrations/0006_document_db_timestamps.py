@@ -0,0 +1,46 @@
+# Generated by Django 5.1.15 on 2026-10-14 03:52
+
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("indexing", "0005_embedding_hnsw_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="document",
+            name="created_at",
+            field=models.DateTimeField(
+                db_default=django.db.models.functions.datetime.Now(), editable=False
+            ),
+        ),
+        migrations.AlterField(
+            model_name="document",
+            name="updated_at",
+            field=models.DateTimeField(
+                db_default=django.db.models.functions.datetime.Now(), editable=False
+            ),
+        ),
+        migrations.RunSQL(
+            sql="""
+                CREATE FUNCTION indexing_document_set_updated_at() RETURNS trigger AS $$
+                BEGIN
+                    -- Same clock as db_default=Now(), unlike the transaction-wide now().
+                    NEW.updated_at = statement_timestamp();
+                    RETURN NEW;
+                END;
+                $$ LANGUAGE plpgsql;
+
+                CREATE TRIGGER indexing_document_updated_at
+                BEFORE UPDATE ON indexing_document
+                FOR EACH ROW EXECUTE FUNCTION indexing_document_set_updated_at();
+            """,
+            reverse_sql="""
+                DROP TRIGGER IF EXISTS indexing_document_updated_at ON indexing_document;
+                DROP FUNCTION IF EXISTS indexing_document_set_updated_at();
+            """,
+        ),
+    ]
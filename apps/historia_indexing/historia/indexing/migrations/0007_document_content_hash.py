@@ -0,0 +1,22 @@
+# Generated by Django 5.1.15 on 2026-10-14 03:54
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("indexing", "0006_document_db_timestamps"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="document",
+            name="content_hash",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.functions.text.MD5("content"),
+                output_field=models.CharField(max_length=32),
+            ),
+        ),
+    ]
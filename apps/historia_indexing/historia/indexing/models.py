@@ -1,28 +1,202 @@
-from django.db import models
-from pgvector.django import VectorField
+import hashlib
+import io
+import struct
+from itertools import islice
+
+import numpy as np
+from django.contrib.postgres.indexes import OpClass
+from django.db import connection, models, transaction
+from django.db.models.functions import MD5, Cast, Now
+from pgvector.django import HnswIndex, VectorField
+
+BULK_BATCH_SIZE = 1000
+HNSW_DIMENSIONS = 768
+COPY_CHUNK_SIZE = 10_000
+
+_PGCOPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+_PGCOPY_TRAILER = struct.pack("!h", -1)
+
+
+def _copy_escape(value):
+    return (
+        value.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _unit_vector(embedding):
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def _embedding_copy_row(embedding_id, vector):
+    # Binary COPY tuple of (id bigint, embedding vector, dimensions integer), where
+    # a vector is sent as int16 dim, int16 unused, then dim big-endian float4s.
+    dimensions = len(vector)
+    return (
+        struct.pack("!hiqihh", 3, 8, embedding_id, 4 + 4 * dimensions, dimensions, 0)
+        + vector.astype(">f4").tobytes()
+        + struct.pack("!ii", 4, dimensions)
+    )
+
+
+def _copy_from(cursor, model, columns, buffer, binary=False):
+    buffer.seek(0)
+    table = connection.ops.quote_name(model._meta.db_table)
+    options = " WITH (FORMAT BINARY)" if binary else ""
+    # copy_expert bypasses CursorWrapper.execute, so map errors to Django's here.
+    with connection.wrap_database_errors:
+        cursor.copy_expert(
+            f"COPY {table} ({', '.join(columns)}) FROM STDIN{options}", buffer
+        )
 
 
 class Document(models.Model):
     title = models.CharField(max_length=255)
     content = models.TextField()
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+    # Kept current by a BEFORE UPDATE trigger (see migration 0006).
+    updated_at = models.DateTimeField(db_default=Now(), editable=False)
+    # Lets callers detect changed content without fetching the content itself.
+    content_hash = models.GeneratedField(
+        expression=MD5("content"),
+        output_field=models.CharField(max_length=32),
+        db_persist=True,
+    )
+
+    @staticmethod
+    def hash_content(content):
+        return hashlib.md5(content.encode(), usedforsecurity=False).hexdigest()
 
 
 class WikipediaDocument(Document):
     url = models.URLField(unique=True)
     metadata = models.JSONField(default=dict)
 
+    @classmethod
+    def content_hashes(cls, urls=None):
+        """Map stored url -> content_hash in one query, optionally limited to `urls`."""
+        documents = (
+            cls.objects.all() if urls is None else cls.objects.filter(url__in=urls)
+        )
+        return dict(documents.values_list("url", "content_hash"))
+
+    @classmethod
+    def bulk_write_documents(cls, documents, batch_size=BULK_BATCH_SIZE):
+        """Insert unsaved documents in bulk, skipping URLs that are already stored.
+
+        bulk_create() refuses multi-table inherited models, so the Document
+        parents are bulk created first and the child rows follow in batched
+        multi-row INSERTs. Returns the documents that were written.
+        """
+        unique = {}
+        for document in documents:
+            # Keep the first copy, matching how an already-stored URL is kept.
+            unique.setdefault(document.url, document)
+        documents = list(unique.values())
+        with transaction.atomic():
+            existing = set(
+                cls.objects.filter(
+                    url__in=[document.url for document in documents]
+                ).values_list("url", flat=True)
+            )
+            documents = [
+                document for document in documents if document.url not in existing
+            ]
+            parents = Document.objects.bulk_create(
+                [
+                    Document(title=document.title, content=document.content)
+                    for document in documents
+                ],
+                batch_size=batch_size,
+            )
+            metadata = cls._meta.get_field("metadata")
+            rows = [
+                (
+                    parent.pk,
+                    document.url,
+                    metadata.get_db_prep_save(document.metadata, connection),
+                )
+                for parent, document in zip(parents, documents)
+            ]
+            table = connection.ops.quote_name(cls._meta.db_table)
+            with connection.cursor() as cursor:
+                for start in range(0, len(rows), batch_size):
+                    batch = rows[start : start + batch_size]
+                    cursor.execute(
+                        f"INSERT INTO {table} (document_ptr_id, url, metadata) "
+                        f"VALUES {', '.join(['(%s, %s, %s)'] * len(batch))}",
+                        [value for row in batch for value in row],
+                    )
+
+        for parent, document in zip(parents, documents):
+            document.id = document.document_ptr_id = parent.pk
+            document.created_at = parent.created_at
+            document.updated_at = parent.updated_at
+            document.content_hash = parent.content_hash
+            document._state.adding = False
+            document._state.db = parent._state.db
+        return documents
+
 
 class Index(models.Model):
     name = models.CharField(max_length=255, unique=True)
     dimensions = models.IntegerField(default=768)  # Default to BERT base dimensions
 
 
+class EmbeddingQuerySet(models.QuerySet):
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        for obj in objs:
+            obj.embedding = _unit_vector(obj.embedding)
+        return super().bulk_create(objs, *args, **kwargs)
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs = list(objs)
+        if "embedding" in fields:
+            for obj in objs:
+                obj.embedding = _unit_vector(obj.embedding)
+        return super().bulk_update(objs, fields, *args, **kwargs)
+
+    def update(self, **kwargs):
+        embedding = kwargs.get("embedding")
+        if embedding is not None and not hasattr(embedding, "resolve_expression"):
+            kwargs["embedding"] = _unit_vector(embedding)
+        return super().update(**kwargs)
+
+
 class Embedding(models.Model):
     embedding = VectorField(dimensions=None)  # Allow variable dimensions
     dimensions = models.IntegerField()  # Store the actual dimensions used
 
+    objects = EmbeddingQuerySet.as_manager()
+
+    class Meta:
+        # HNSW needs a fixed dimension, so index the default size through a cast.
+        # Queries must filter on dimensions and order by the same cast to use it.
+        # Vectors are stored unit norm, so inner product ranks the same as cosine.
+        # The ORM write paths normalize literal vectors; expressions and raw SQL
+        # must supply unit vectors themselves.
+        indexes = [
+            HnswIndex(
+                OpClass(
+                    Cast("embedding", VectorField(dimensions=HNSW_DIMENSIONS)),
+                    name="vector_ip_ops",
+                ),
+                name="emb_hnsw",
+                m=16,
+                ef_construction=64,
+                condition=models.Q(dimensions=HNSW_DIMENSIONS),
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.embedding = _unit_vector(self.embedding)
+        super().save(*args, **kwargs)
+
 
 class IndexedDocumentSnippet(models.Model):
     index = models.ForeignKey(Index, on_delete=models.CASCADE)
@@ -32,3 +206,71 @@ class IndexedDocumentSnippet(models.Model):
 
     class Meta:
         unique_together = ("index", "document", "snippet")
+
+    @classmethod
+    def bulk_write_embeddings(cls, index, rows, chunk_size=COPY_CHUNK_SIZE):
+        """Stream (document_id, snippet, embedding) rows into `index` via COPY.
+
+        Embedding ids are reserved from the sequence up front so both tables
+        can be loaded with COPY, one round-trip per table per chunk. Vectors are
+        normalized to unit length and sent in COPY's binary format. A
+        (document_id, snippet) pair that is repeated or already stored for the
+        index is skipped, so the unique constraint never aborts the load.
+        Returns the number of snippets written.
+        """
+        rows = iter(rows)
+        seen = set()
+        written = 0
+        with transaction.atomic(), connection.cursor() as cursor:
+            while chunk := list(islice(rows, chunk_size)):
+                seen.update(
+                    cls.objects.filter(
+                        index=index, document_id__in={row[0] for row in chunk}
+                    ).values_list("document_id", "snippet")
+                )
+                new_rows = []
+                for row in chunk:
+                    key = (row[0], row[1])
+                    if key not in seen:
+                        seen.add(key)
+                        new_rows.append(row)
+                chunk = new_rows
+                if not chunk:
+                    continue
+
+                cursor.execute(
+                    "SELECT nextval(pg_get_serial_sequence(%s, 'id')) "
+                    "FROM generate_series(1, %s)",
+                    [Embedding._meta.db_table, len(chunk)],
+                )
+                embedding_ids = [row[0] for row in cursor.fetchall()]
+
+                embeddings = io.BytesIO()
+                embeddings.write(_PGCOPY_HEADER)
+                snippets = io.StringIO()
+                for embedding_id, (document_id, snippet, vector) in zip(
+                    embedding_ids, chunk
+                ):
+                    embeddings.write(
+                        _embedding_copy_row(embedding_id, _unit_vector(vector))
+                    )
+                    snippets.write(
+                        f"{index.pk}\t{document_id}\t{_copy_escape(snippet)}\t{embedding_id}\n"
+                    )
+                embeddings.write(_PGCOPY_TRAILER)
+
+                _copy_from(
+                    cursor,
+                    Embedding,
+                    ("id", "embedding", "dimensions"),
+                    embeddings,
+                    binary=True,
+                )
+                _copy_from(
+                    cursor,
+                    cls,
+                    ("index_id", "document_id", "snippet", "embedding_id"),
+                    snippets,
+                )
+                written += len(chunk)
+        return written
@@ -0,0 +1,28 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("generation", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+                CREATE FUNCTION generation_question_set_query_sha256() RETURNS trigger AS $$
+                BEGIN
+                    NEW.query_sha256 = sha256(convert_to(NEW.query, 'UTF8'));
+                    RETURN NEW;
+                END;
+                $$ LANGUAGE plpgsql;
+
+                CREATE TRIGGER generation_question_query_sha256
+                BEFORE INSERT OR UPDATE ON generation_question
+                FOR EACH ROW EXECUTE FUNCTION generation_question_set_query_sha256();
+            """,
+            reverse_sql="""
+                DROP TRIGGER IF EXISTS generation_question_query_sha256 ON generation_question;
+                DROP FUNCTION IF EXISTS generation_question_set_query_sha256();
+            """,
+        ),
+    ]
@@ -1,12 +1,28 @@
+import hashlib
+
 from django.db import models
 
 
 class Question(models.Model):
     query = models.TextField()
+    # Set by a BEFORE INSERT OR UPDATE trigger (see migration 0002), so bulk_create
+    # and QuerySet.update() keep it in sync; save() mirrors it on the instance.
+    query_sha256 = models.BinaryField(max_length=32, unique=True, editable=False)
 
     def __str__(self):
         return self.query
 
+    @staticmethod
+    def hash_query(query):
+        return hashlib.sha256(query.encode()).digest()
+
+    def save(self, *args, **kwargs):
+        self.query_sha256 = self.hash_query(self.query)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "query" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "query_sha256"}
+        super().save(*args, **kwargs)
+
 
 class Generation(models.Model):
     question = models.ForeignKey(
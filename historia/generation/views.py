@@ -1,6 +1,9 @@
+from django.db import IntegrityError, transaction
 from rest_framework import viewsets, serializers
 from .models import Generation, Question
 
+DUPLICATE_QUERY_MESSAGE = "A question with this query already exists."
+
 
 class GenerationSerializer(serializers.ModelSerializer):
     class Meta:
@@ -15,12 +18,34 @@ class QuestionSerializer(serializers.ModelSerializer):
         model = Question
         fields = ["id", "query", "generations"]
 
+    def validate_query(self, value):
+        questions = Question.objects.filter(query_sha256=Question.hash_query(value))
+        if self.instance is not None:
+            questions = questions.exclude(pk=self.instance.pk)
+        if questions.exists():
+            raise serializers.ValidationError(DUPLICATE_QUERY_MESSAGE)
+        return value
+
 
 class GenerationViewSet(viewsets.ModelViewSet):
-    queryset = Generation.objects.all()
+    queryset = Generation.objects.order_by("id")
     serializer_class = GenerationSerializer
 
 
 class QuestionViewSet(viewsets.ModelViewSet):
-    queryset = Question.objects.all()
+    queryset = Question.objects.prefetch_related("generations").order_by("id")
     serializer_class = QuestionSerializer
+
+    def perform_create(self, serializer):
+        self._save_unique(serializer)
+
+    def perform_update(self, serializer):
+        self._save_unique(serializer)
+
+    def _save_unique(self, serializer):
+        # validate_query can race a concurrent write of the same query.
+        try:
+            with transaction.atomic():
+                serializer.save()
+        except IntegrityError:
+            raise serializers.ValidationError({"query": [DUPLICATE_QUERY_MESSAGE]})
@@ -41,6 +41,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "health_check",
     "health_check.db",
     "health_check.cache",
@@ -83,7 +84,19 @@ WSGI_APPLICATION = "historia.historia.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
-DATABASES = {"default": dj_database_url.config(default=env("POSTGRES_URL", default=""))}
+DATABASES = {
+    "default": dj_database_url.config(
+        default=env("POSTGRES_URL", default=""),
+        conn_max_age=env.int("CONN_MAX_AGE", default=600),
+        conn_health_checks=True,
+    )
+}
+
+
+REST_FRAMEWORK = {
+    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "PAGE_SIZE": 50,
+}
 
 
 # Password validation
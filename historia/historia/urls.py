@@ -17,13 +17,18 @@ Including another URLconf
 
 from django.contrib import admin
 from django.urls import path, include
-from django.http import JsonResponse
+from django.http import HttpResponse
 from datetime import datetime
 
+_SERVER_INFO_PREFIX = b'{"datetime":"'
+_SERVER_INFO_SUFFIX = b'","name":"Historia AI Server"}'
+
 
 def server_info(request):
-    return JsonResponse(
-        {"datetime": datetime.now().isoformat(), "name": "Historia AI Server"}
+    # Only the timestamp changes, so skip the JSON encoder for this response.
+    return HttpResponse(
+        _SERVER_INFO_PREFIX + datetime.now().isoformat().encode() + _SERVER_INFO_SUFFIX,
+        content_type="application/json",
     )
 
 
@@ -8,8 +8,9 @@ def root():
     response = httpx.get(HISTORIA_ASK_URL)
     response.raise_for_status()
 
-    print(response.json())
-    return response.json()
+    data = response.json()
+    print(data)
+    return data
 
 
 # Dictionary mapping function names to functions